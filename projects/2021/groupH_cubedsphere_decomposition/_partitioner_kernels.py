@@ -0,0 +1,180 @@
+"""Integer kernels of the cubed-sphere partitioner.
+
+These are compiled with numba for the given static types when numba is
+installed, and run as plain Python functions otherwise.
+"""
+import functools
+from typing import Tuple
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# [side][position along the edge] -> (first, stop) offsets from the root rank
+OffsetTable = Tuple[Tuple[Tuple[int, int], ...], Tuple[Tuple[int, int], ...]]
+
+
+def jit(signature: str):
+    """Compiles the decorated function with numba for the given signature
+    if numba is installed, otherwise returns the function unchanged.
+
+    The kernels only divide by layout sizes and divisors which are at least
+    one, so they are compiled without the checks for division by zero. Array
+    arguments which may be shared caches are declared readonly, numba accepts
+    writable arrays for them as well.
+    """
+
+    def decorator(func):
+        if numba is None:
+            return func
+        return numba.njit(signature, cache=True, error_model="numpy")(func)
+
+    return decorator
+
+
+@jit("int64(int64, int64, int64, int64)")
+def cumsum_boundary_seq(position, n_along, n_across, div):
+    """Returns the cumulated boundary sequence of an edge with n_across ranks,
+    which borders an edge with n_along ranks, up to and including position.
+
+    This is the closed form of the running sum, the sequence itself is never
+    built. For dividable layouts the sum is divided by div (if div >= 1), for
+    other layouts one is subtracted from every boundary count.
+    """
+    if n_along % n_across == 0 or n_across % n_along == 0: # layout is dividable
+        if n_along >= n_across:
+            cumsum = (position + 1)*(n_along // n_across)
+        else:
+            cumsum = position + 1
+        if(div >= 1):
+            cumsum = cumsum//div
+        return cumsum
+    # the boundary counts after the first one telescope, (num2before - num2after) of
+    # one position is the difference of num1//n_across of two consecutive positions
+    return (
+        n_along // n_across
+        + (n_along*n_across - n_along)//n_across
+        - (n_along*n_across - (position + 1)*n_along)//n_across
+    )
+
+
+@jit("int64[:](Array(boolean, 1, 'A', readonly=True), int64[:], float64[:], boolean)")
+def extent_from_layout(is_interface, extent, layout_factors, inverse):
+    """Returns the extents multiplied by the layout factors, or by their inverse,
+    where the extent of interface dimensions is multiplied without their last point.
+    """
+    scaled_extent = np.empty(len(extent), dtype=np.int64)
+    for i in range(len(extent)):
+        if inverse:
+            layout_factor = 1.0 / layout_factors[i]
+        else:
+            layout_factor = layout_factors[i]
+        if is_interface[i]:
+            add_extent = -1
+        else:
+            add_extent = 0
+        # casting truncates towards zero like int() does
+        scaled_extent[i] = np.int64((extent[i] + add_extent)*layout_factor - add_extent)
+    return scaled_extent
+
+
+@jit("UniTuple(int64, 2)(int64, int64, int64)")
+def lr_bounds(layout_0, layout_1, rank_position_y):
+    """Returns start and end of the to_ranks shared with a rank on the left/right
+    edge of a tile, as positions along the flipped edge of the other tile.
+    """
+    div = layout_1//layout_0
+    if layout_0 % layout_1 == 0 or layout_1 % layout_0 == 0: # layout is dividable
+        if layout_0 >= layout_1:
+            start = cumsum_boundary_seq(rank_position_y-1, layout_0, layout_1, div)
+            end = cumsum_boundary_seq(rank_position_y, layout_0, layout_1, div)
+        else:
+            start = rank_position_y//div
+            if rank_position_y == 0:
+                end = cumsum_boundary_seq(0, layout_0, layout_1, div)//div
+            else:
+                end = start + 1
+    else:
+        if rank_position_y == 0:
+            start = 0
+        else:
+            start = cumsum_boundary_seq(rank_position_y-1, layout_0, layout_1, div)
+        end = cumsum_boundary_seq(rank_position_y, layout_0, layout_1, div) + 1
+    return start, end
+
+
+@jit("int64[:, :](int64, int64)")
+def lr_bounds_along_edge(layout_0, layout_1):
+    """Returns lr_bounds of every position along the left/right edge of a tile"""
+    bounds = np.empty((layout_1, 2), dtype=np.int64)
+    for rank_position_y in range(layout_1):
+        start, end = lr_bounds(layout_0, layout_1, rank_position_y)
+        bounds[rank_position_y, 0] = start
+        bounds[rank_position_y, 1] = end
+    return bounds
+
+
+@jit("UniTuple(int64, 2)(int64, int64, int64)")
+def ul_bounds(layout_0, layout_1, rank_position_x):
+    """Returns start and end of the to_ranks shared with a rank on the upper/lower
+    edge of a tile, as positions along the flipped edge of the other tile.
+    """
+    div = layout_1//layout_0
+    if layout_0 % layout_1 == 0 or layout_1 % layout_0 == 0: # layout is dividable
+        if div > 1:
+            start = rank_position_x*div
+            end = start + div
+        else:
+            start = rank_position_x//(layout_0//layout_1)
+            end = start + 1
+    else:
+        if rank_position_x == 0:
+            start = 0
+        else:
+            start = cumsum_boundary_seq(rank_position_x-1, layout_1, layout_0, div)
+        end = cumsum_boundary_seq(rank_position_x, layout_1, layout_0, div) + 1
+    return start, end
+
+
+@jit("int64[:, :](int64, int64)")
+def ul_bounds_along_edge(layout_0, layout_1):
+    """Returns ul_bounds of every position along the upper/lower edge of a tile"""
+    bounds = np.empty((layout_0, 2), dtype=np.int64)
+    for rank_position_x in range(layout_0):
+        start, end = ul_bounds(layout_0, layout_1, rank_position_x)
+        bounds[rank_position_x, 0] = start
+        bounds[rank_position_x, 1] = end
+    return bounds
+
+
+@functools.lru_cache(maxsize=None)
+def to_rank_offsets(layout_0: int, layout_1: int) -> Tuple[OffsetTable, OffsetTable]:
+    """Returns the to_rank offsets of the left/right and the upper/lower edges
+    of tiles with the given layout.
+
+    Relative to the root rank of the other tile, the shared to_ranks only depend
+    on the layout, the side of the tile and the position along the edge. They are
+    evenly spaced along the flipped edge, so for every side and position only
+    the (first, stop) offsets of their range are tabulated: the left/right table
+    is indexed by [on_left][rank_position_y] and the ranks step by -1, the
+    upper/lower table by [on_top][rank_position_x] and the ranks step by
+    -layout_0.
+    """
+    lr_offsets = ([], [])
+    for start, end in lr_bounds_along_edge(layout_0, layout_1).tolist():
+        for on_left, base in ((False, 0), (True, layout_0*(layout_1-1))):
+            lr_offsets[on_left].append(
+                (base + layout_0 - 1 - start, base + layout_0 - 1 - end)
+            )
+    ul_offsets = ([], [])
+    for start, end in ul_bounds_along_edge(layout_0, layout_1).tolist():
+        for on_top, base in ((False, layout_0-1), (True, 0)):
+            ul_offsets[on_top].append(
+                (
+                    base + layout_0*(layout_1 - 1 - start),
+                    base + layout_0*(layout_1 - 1 - end),
+                )
+            )
+    return tuple(map(tuple, lr_offsets)), tuple(map(tuple, ul_offsets))
@@ -1,5 +1,4 @@
-from typing import Tuple, Callable, Iterable, Optional, Union, cast, Sequence
-import copy
+from typing import Tuple, Callable, Iterable, List, Optional, Union, Sequence
 import abc
 import functools
 import dataclasses
@@ -16,13 +15,42 @@ from .constants import (
 )
 import numpy as np
 from . import boundary as bd
+from . import _partitioner_kernels
 from .quantity import QuantityMetadata
 
-BOUNDARY_CACHE_SIZE = None
-
 
 __all__ = ["TilePartitioner", "CubedSpherePartitioner", "get_tile_index"]
 
+# number of tile metadata and subtile slice results kept per function
+METADATA_CACHE_SIZE = 4096
+
+# bits of TilePartitioner.edge_flags, set for ranks on the respective edge of a tile
+ON_TILE_LEFT = 1
+ON_TILE_RIGHT = 2
+ON_TILE_TOP = 4
+ON_TILE_BOTTOM = 8
+
+
+class _NotComputed:
+    """Marks entries of a boundary table which have not been computed yet"""
+
+    def __reduce__(self):
+        # unpickle as the module-level instance, so identity checks keep working
+        return "_NOT_COMPUTED"
+
+
+_NOT_COMPUTED = _NotComputed()
+
+
+def _by_boundary_type(values: dict) -> tuple:
+    """Returns the values of a {boundary_type: value} dict as a tuple which
+    can be indexed by boundary type.
+    """
+    by_type = [None] * (max(values) + 1)
+    for boundary_type, value in values.items():
+        by_type[boundary_type] = value
+    return tuple(by_type)
+
 
 def get_tile_index(rank: int, total_ranks: int) -> int:
     """
@@ -107,6 +135,53 @@ class TilePartitioner(Partitioner):
         """Create an object for fv3gfs tile decomposition.
         """
         self.layout = layout
+        self._subtile_indices = _subtile_indices(tuple(layout))
+        ranks = np.arange(self.total_ranks, dtype=np.int32)
+        rank_position_y, rank_position_x = np.divmod(ranks, self.layout[0])
+        # to_rank of each boundary type for every rank on the tile
+        self._to_west = np.where(
+            rank_position_x == 0, ranks + self.layout[0] - 1, ranks - 1
+        ).astype(np.int32)
+        self._to_east = np.where(
+            rank_position_x == self.layout[0] - 1,
+            ranks - self.layout[0] + 1,
+            ranks + 1,
+        ).astype(np.int32)
+        self._to_north = np.where(
+            rank_position_y == self.layout[1] - 1,
+            ranks - (self.layout[1] - 1) * self.layout[0],
+            ranks + self.layout[1],
+        ).astype(np.int32)
+        self._to_south = np.where(
+            rank_position_y == 0,
+            ranks + (self.layout[1] - 1) * self.layout[0],
+            ranks - self.layout[1],
+        ).astype(np.int32)
+        # the tile edges every rank on the tile lies on, as ON_TILE_* bits
+        self.edge_flags = (
+            np.where(rank_position_x == 0, ON_TILE_LEFT, 0)
+            | np.where(rank_position_x == self.layout[0] - 1, ON_TILE_RIGHT, 0)
+            | np.where(rank_position_y == self.layout[1] - 1, ON_TILE_TOP, 0)
+            | np.where(rank_position_y == 0, ON_TILE_BOTTOM, 0)
+        ).astype(np.uint8)
+        self.edge_flags.flags.writeable = False
+        # corners go along the west/east edge first, which stays on the same tile row
+        self._to_northwest = self._to_north[self._to_west]
+        self._to_northeast = self._to_north[self._to_east]
+        self._to_southwest = self._to_south[self._to_west]
+        self._to_southeast = self._to_south[self._to_east]
+        self._to_ranks_by_type = _by_boundary_type(
+            {
+                WEST: self._to_west,
+                EAST: self._to_east,
+                NORTH: self._to_north,
+                SOUTH: self._to_south,
+                NORTHWEST: self._to_northwest,
+                NORTHEAST: self._to_northeast,
+                SOUTHWEST: self._to_southwest,
+                SOUTHEAST: self._to_southeast,
+            }
+        )
 
     @classmethod
     def from_namelist(cls, namelist):
@@ -119,7 +194,7 @@ class TilePartitioner(Partitioner):
 
     def subtile_index(self, rank: int) -> Tuple[int, int, int, int]:
         """Return the (y, x) subtile position of a given rank as an integer number of subtiles."""
-        return subtile_index(rank, self.total_ranks, self.layout)
+        return self._subtile_indices[rank % self.total_ranks]
 
     @property
     def total_ranks(self) -> int:
@@ -178,16 +253,16 @@ class TilePartitioner(Partitioner):
         )
 
     def on_tile_top(self, rank: int) -> bool:
-        return on_tile_top(self.subtile_index(rank), self.layout)
+        return bool(self.edge_flags[rank % self.total_ranks] & ON_TILE_TOP)
 
     def on_tile_bottom(self, rank: int) -> bool:
-        return on_tile_bottom(self.subtile_index(rank))
+        return bool(self.edge_flags[rank % self.total_ranks] & ON_TILE_BOTTOM)
 
     def on_tile_left(self, rank: int) -> bool:
-        return on_tile_left(self.subtile_index(rank))
+        return bool(self.edge_flags[rank % self.total_ranks] & ON_TILE_LEFT)
 
     def on_tile_right(self, rank: int) -> bool:
-        return on_tile_right(self.subtile_index(rank), self.layout)
+        return bool(self.edge_flags[rank % self.total_ranks] & ON_TILE_RIGHT)
 
     def boundary(self, boundary_type: int, rank: int) -> Optional[bd.SimpleBoundary]:
         """Returns a boundary of the requested type for a given rank.
@@ -202,92 +277,40 @@ class TilePartitioner(Partitioner):
         Returns:
             boundary
         """
-        boundary = copy.copy(self._cached_boundary(boundary_type, rank))
-        return boundary
+        return self._cached_boundary(boundary_type, rank)
 
-    @functools.lru_cache(maxsize=BOUNDARY_CACHE_SIZE)
-    def _cached_boundary(
-        self, boundary_type: int, rank: int
-    ) -> Optional[bd.SimpleBoundary]:
-        boundary = {
-            WEST: self._left_edge,
-            EAST: self._right_edge,
-            NORTH: self._top_edge,
-            SOUTH: self._bottom_edge,
-            NORTHWEST: self._top_left_corner,
-            NORTHEAST: self._top_right_corner,
-            SOUTHWEST: self._bottom_left_corner,
-            SOUTHEAST: self._bottom_right_corner,
-        }[boundary_type](rank)
-        return boundary
-
-    def _left_edge(self, rank: int) -> bd.SimpleBoundary:
-        if self.on_tile_left(rank):
-            #switched indeces of layout
-            to_rank = rank + self.layout[0] - 1
-        else:
-            to_rank = rank - 1
+    def _cached_boundary(self, boundary_type: int, rank: int) -> bd.SimpleBoundary:
         return bd.SimpleBoundary(
-            boundary_type=constants.WEST,
-            from_rank=rank,
-            to_rank=to_rank,
-            n_clockwise_rotations=0,
-        )
-
-    def _right_edge(self, rank: int) -> bd.SimpleBoundary:
-        if self.on_tile_right(rank):
-            #switched indeces of layout
-            to_rank = rank - self.layout[0] + 1
-        else:
-            to_rank = rank + 1
-        return bd.SimpleBoundary(
-            boundary_type=constants.EAST,
-            from_rank=rank,
-            to_rank=to_rank,
-            n_clockwise_rotations=0,
-        )
-
-    def _top_edge(self, rank: int) -> bd.SimpleBoundary:
-        if self.on_tile_top(rank):
-            #switched indeces of layout
-            to_rank = rank - (self.layout[1] - 1) * self.layout[0]
-        else:
-            to_rank = rank + self.layout[1]
-        return bd.SimpleBoundary(
-            boundary_type=constants.NORTH,
-            from_rank=rank,
-            to_rank=to_rank,
-            n_clockwise_rotations=0,
-        )
-
-    def _bottom_edge(self, rank: int) -> bd.SimpleBoundary:
-        if self.on_tile_bottom(rank):
-            #switched indeces of layout
-            to_rank = rank + (self.layout[1] - 1) * self.layout[0]
-        else:
-            to_rank = rank - self.layout[1]
-        return bd.SimpleBoundary(
-            boundary_type=constants.SOUTH,
+            boundary_type=boundary_type,
             from_rank=rank,
-            to_rank=to_rank,
+            to_rank=self.to_rank(boundary_type, rank),
             n_clockwise_rotations=0,
         )
 
-    def _top_left_corner(self, rank: int) -> Optional[bd.SimpleBoundary]:
-        return _get_corner(constants.NORTHWEST, rank, self._left_edge, self._top_edge)
+    def all_boundaries(self) -> np.ndarray:
+        """Returns the boundaries of all ranks on the tile as an integer array.
 
-    def _top_right_corner(self, rank: int) -> Optional[bd.SimpleBoundary]:
-        return _get_corner(constants.NORTHEAST, rank, self._right_edge, self._top_edge)
+        Returns:
+            boundaries: [to_rank, n_clockwise_rotations, boundary_type, from_rank]
+                rows indexed by [boundary_type, rank]
+        """
+        n_boundary_types = len(self._to_ranks_by_type)
+        boundaries = np.zeros((n_boundary_types, self.total_ranks, 4), dtype=np.int32)
+        boundaries[:, :, 0] = np.stack(self._to_ranks_by_type)
+        boundaries[:, :, 2] = np.arange(n_boundary_types, dtype=np.int32)[:, None]
+        boundaries[:, :, 3] = np.arange(self.total_ranks, dtype=np.int32)
+        return boundaries
 
-    def _bottom_left_corner(self, rank: int) -> Optional[bd.SimpleBoundary]:
-        return _get_corner(
-            constants.SOUTHWEST, rank, self._left_edge, self._bottom_edge
-        )
+    def to_rank(self, boundary_type: int, rank: int) -> int:
+        """Returns the rank across a boundary of the requested type for a given rank.
 
-    def _bottom_right_corner(self, rank: int) -> Optional[bd.SimpleBoundary]:
-        return _get_corner(
-            constants.SOUTHEAST, rank, self._right_edge, self._bottom_edge
-        )
+        Target ranks will be on the same tile as the given rank, wrapping around as
+        in a doubly-periodic boundary condition.
+        """
+        # rank may lie on any tile of a cube, the tables are relative to its tile
+        within_tile_rank = rank % self.total_ranks
+        to_ranks = self._to_ranks_by_type[boundary_type]
+        return rank - within_tile_rank + int(to_ranks[within_tile_rank])
 
     def fliplr_rank(self, rank: int) -> int:
         return fliplr_subtile_rank(rank, self.layout)
@@ -296,23 +319,6 @@ class TilePartitioner(Partitioner):
         return rotate_subtile_rank(rank, self.layout, n_clockwise_rotations)
 
 
-def _get_corner(
-    boundary_type: int,
-    rank: int,
-    edge_func_1: Callable[[int], bd.Boundary],
-    edge_func_2: Callable[[int], bd.Boundary],
-):
-    edge_1 = edge_func_1(rank)
-    edge_2 = edge_func_2(edge_1.to_rank)
-    rotations = edge_1.n_clockwise_rotations + edge_2.n_clockwise_rotations
-    return bd.SimpleBoundary(
-        boundary_type=boundary_type,
-        from_rank=rank,
-        to_rank=edge_2.to_rank,
-        n_clockwise_rotations=rotations,
-    )
-
-
 class CubedSpherePartitioner(Partitioner):
     def __init__(self, tile: TilePartitioner):
         """Create an object for fv3gfs cubed-sphere domain decomposition.
@@ -323,6 +329,81 @@ class CubedSpherePartitioner(Partitioner):
         if not isinstance(tile, TilePartitioner):
             raise TypeError("tile must be a TilePartitioner")
         self.tile = tile
+        ranks_per_tile = int(self.tile.total_ranks)
+        if ranks_per_tile & (ranks_per_tile - 1) == 0:
+            # a power of two ranks per tile, divide and round down by shift and mask
+            self._tile_index_shift = ranks_per_tile.bit_length() - 1
+            self._tile_root_rank_mask = ~(ranks_per_tile - 1)
+            self.tile_index = self._shifted_tile_index
+            self.tile_root_rank = self._masked_tile_root_rank
+        # the boundary sequences only depend on the layout, compute them once
+        self._lr_boundary_seq = _edge_boundary_seq(
+            int(self.tile.layout[0]), int(self.tile.layout[1])
+        )
+        self._ul_boundary_seq = _edge_boundary_seq(
+            int(self.tile.layout[1]), int(self.tile.layout[0])
+        )
+        # the same counts as Python ints, to look up the count of a single rank
+        self._lr_boundary_counts = tuple(self._lr_boundary_seq.tolist())
+        self._ul_boundary_counts = tuple(self._ul_boundary_seq.tolist())
+        (
+            self._lr_to_rank_offsets,
+            self._ul_to_rank_offsets,
+        ) = _partitioner_kernels.to_rank_offsets(
+            int(self.tile.layout[0]), int(self.tile.layout[1])
+        )
+        self._edge_dispatch = _by_boundary_type(
+            {
+                WEST: self._left_edge,
+                EAST: self._right_edge,
+                NORTH: self._top_edge,
+                SOUTH: self._bottom_edge,
+                NORTHWEST: self._top_left_corner,
+                NORTHEAST: self._top_right_corner,
+                SOUTHWEST: self._bottom_left_corner,
+                SOUTHEAST: self._bottom_right_corner,
+            }
+        )
+        # boundaries by [boundary_type, rank], corners are filled on first request;
+        # the edges of a rank are stored as a tuple, as the table is shared by calls
+        self._boundaries = np.full(
+            (len(self._edge_dispatch), self.total_ranks), _NOT_COMPUTED, dtype=object
+        )
+        for boundary_type, compute_edge in (
+            (WEST, self._compute_left_edge),
+            (EAST, self._compute_right_edge),
+            (NORTH, self._compute_top_edge),
+            (SOUTH, self._compute_bottom_edge),
+        ):
+            for rank in range(self.total_ranks):
+                self._boundaries[boundary_type, rank] = tuple(compute_edge(rank))
+        # the edge boundaries packed as [to_rank, n_clockwise_rotations, boundary_type,
+        # from_rank] rows, the rows of one rank are contiguous and start at its offset
+        edge_boundaries = [
+            [
+                boundary
+                for boundary_type in (WEST, EAST, NORTH, SOUTH)
+                for boundary in self._boundaries[boundary_type, rank]
+            ]
+            for rank in range(self.total_ranks)
+        ]
+        self._boundary_rows = np.array(
+            [
+                (
+                    boundary.to_rank % self.total_ranks,
+                    boundary.n_clockwise_rotations,
+                    boundary.boundary_type,
+                    boundary.from_rank,
+                )
+                for boundaries in edge_boundaries
+                for boundary in boundaries
+            ],
+            dtype=np.int32,
+        ).reshape(-1, 4)
+        self._boundary_rows.flags.writeable = False
+        self._boundary_row_offsets = np.cumsum(
+            [0] + [len(boundaries) for boundaries in edge_boundaries]
+        )
 
     @classmethod
     def from_namelist(cls, namelist):
@@ -345,6 +426,12 @@ class CubedSpherePartitioner(Partitioner):
         """Returns the lowest rank on the same tile as a given rank."""
         return self.tile.total_ranks * (rank // self.tile.total_ranks)
 
+    def _shifted_tile_index(self, rank: int) -> int:
+        return rank >> self._tile_index_shift
+
+    def _masked_tile_root_rank(self, rank: int) -> int:
+        return rank & self._tile_root_rank_mask
+
     @property
     def layout(self) -> Tuple[int, int]:
         return self.tile.layout
@@ -354,133 +441,195 @@ class CubedSpherePartitioner(Partitioner):
         """the number of ranks on the cubed sphere"""
         return 6 * self.tile.total_ranks
 
-    def boundary(self, boundary_type: int, rank: int) -> Optional[bd.SimpleBoundary]:
-        """Returns a boundary of the requested type for a given rank, or None.
+    def boundary(
+        self, boundary_type: int, rank: int
+    ) -> Union[Tuple[bd.SimpleBoundary, ...], bd.SimpleBoundary, None]:
+        """Returns the boundaries of the requested type for a given rank.
 
-        On tile corners, the boundary across that corner does not exist.
+        An edge of a rank can border several ranks on a rotated tile, so for the
+        WEST, EAST, NORTH and SOUTH boundary types this is a tuple with one
+        boundary per shared rank, which may be empty. For the corner types this
+        is a single boundary, or None: on tile corners, the boundary across that
+        corner does not exist.
 
         Args:
             boundary_type: the type of boundary
             rank: the processor rank
 
         Returns:
-            boundary
+            boundaries: a tuple of edge boundaries, or a corner boundary or None
         """
-        boundary = copy.copy(self._cached_boundary(boundary_type, rank))
+        boundary = self._boundaries[boundary_type, rank]
+        if boundary is _NOT_COMPUTED:
+            boundary = self._cached_boundary(boundary_type, rank)
+            self._boundaries[boundary_type, rank] = boundary
+        # SimpleBoundary is mutable, hand out copies of the stored boundaries;
+        # like the corners, the edge to_ranks are wrapped around the cube
+        if isinstance(boundary, tuple):
+            total_ranks = self.total_ranks
+            boundary = tuple(
+                dataclasses.replace(edge, to_rank=edge.to_rank % total_ranks)
+                for edge in boundary
+            )
+        elif boundary is not None:
+            boundary = dataclasses.replace(boundary)
         return boundary
 
-    @functools.lru_cache(maxsize=BOUNDARY_CACHE_SIZE)
+    def boundary_array(self, rank: int) -> np.ndarray:
+        """Returns the edge boundaries of a given rank as an integer array.
+
+        Args:
+            rank: the processor rank
+
+        Returns:
+            boundaries: one [to_rank, n_clockwise_rotations, boundary_type, from_rank]
+                row per boundary on the west, east, north and south edge
+        """
+        start, end = self._boundary_row_offsets[rank : rank + 2]
+        return self._boundary_rows[start:end]
+
+    def all_boundaries(self) -> np.ndarray:
+        """Returns the edge boundaries of all ranks as an integer array.
+
+        Returns:
+            boundaries: the rows of boundary_array for every rank, in order of rank
+        """
+        return self._boundary_rows
+
     def _cached_boundary(
         self, boundary_type: int, rank: int
     ) -> Optional[bd.SimpleBoundary]:
-        boundary = {
-            WEST: self._left_edge,
-            EAST: self._right_edge,
-            NORTH: self._top_edge,
-            SOUTH: self._bottom_edge,
-            NORTHWEST: self._top_left_corner,
-            NORTHEAST: self._top_right_corner,
-            SOUTHWEST: self._bottom_left_corner,
-            SOUTHEAST: self._bottom_right_corner,
-        }[boundary_type](rank)
+        boundary = self._edge_dispatch[boundary_type](rank)
         if boundary is not None:
-            boundary.to_rank = boundary.to_rank % self.total_ranks
+            boundary = dataclasses.replace(
+                boundary, to_rank=boundary.to_rank % self.total_ranks
+            )
         return boundary
 
-    def _left_edge(self, rank: int) -> bd.SimpleBoundary:
-        boundary_list = []
-        if self.tile.on_tile_left(rank):
-            if is_even(self.tile_index(rank)):
-                to_root_rank = self.tile_root_rank((rank - 2 * (self.tile.total_ranks))%self.total_ranks)
+    def _left_edge(self, rank: int) -> Tuple[bd.SimpleBoundary, ...]:
+        return self._boundaries[WEST, rank]
+
+    def _compute_left_edge(self, rank: int) -> List[bd.SimpleBoundary]:
+        ttr = self.tile.total_ranks
+        tr = self.total_ranks
+        ti = self.tile_index(rank)
+        even = (ti & 1) == 0
+        flags = self.tile.edge_flags[rank % ttr]
+        if flags & ON_TILE_LEFT:
+            if even:
+                to_root_rank = ((ti - 2) % 6) * ttr # root rank of the tile two tiles before
                 to_ranks_seq = self.lr_to_ranks(rank, to_root_rank)
-                for n in range(0,len(to_ranks_seq)):
-                    boundary_list.append(bd.SimpleBoundary(
-                        boundary_type=constants.WEST,
-                        from_rank=rank,
-                        to_rank=int(to_ranks_seq[n]%self.total_ranks),
-                        n_clockwise_rotations=1,
-                    ))
+                boundary_list = self._rotated_boundaries(constants.WEST, rank, to_ranks_seq, 1)
             else:
-                boundary_list.append(cast(bd.SimpleBoundary, self.tile.boundary(WEST, rank=rank)))
-                boundary_list[0].to_rank -= self.tile.total_ranks
-                if boundary_list[0].to_rank > self.total_ranks:
-                    boundary_list[0].to_rank = boundary_list[0].to_rank%self.total_ranks
+                to_rank = (self.tile.to_rank(WEST, rank) - ttr)%tr
+                boundary_list = [self._unrotated_boundary(constants.WEST, rank, to_rank)]
         else:
-            boundary_list.append(cast(bd.SimpleBoundary, self.tile.boundary(WEST, rank=rank)))
+            to_rank = self.tile.to_rank(WEST, rank)
+            boundary_list = [self._unrotated_boundary(constants.WEST, rank, to_rank)]
         return boundary_list
 
-    def _right_edge(self, rank: int) -> bd.SimpleBoundary:
-        boundary_list = []
-        if self.tile.on_tile_right(rank):
-            if not is_even(self.tile_index(rank)):
-                to_root_rank = self.tile_root_rank(rank) + (2*self.tile.total_ranks)
+    def _right_edge(self, rank: int) -> Tuple[bd.SimpleBoundary, ...]:
+        return self._boundaries[EAST, rank]
+
+    def _compute_right_edge(self, rank: int) -> List[bd.SimpleBoundary]:
+        ttr = self.tile.total_ranks
+        tr = self.total_ranks
+        ti = self.tile_index(rank)
+        even = (ti & 1) == 0
+        flags = self.tile.edge_flags[rank % ttr]
+        if flags & ON_TILE_RIGHT:
+            if not even:
+                to_root_rank = self.tile_root_rank(rank) + 2*ttr
                 to_ranks_seq = self.lr_to_ranks(rank, to_root_rank)
-                for n in range(0,len(to_ranks_seq)):
-                    boundary_list.append(bd.SimpleBoundary(
-                        boundary_type=constants.EAST,
-                        from_rank=rank,
-                        to_rank=int(to_ranks_seq[n]%self.total_ranks),
-                        n_clockwise_rotations=1,
-                    ))
+                boundary_list = self._rotated_boundaries(constants.EAST, rank, to_ranks_seq, 1)
             else:
-                boundary_list.append(cast(bd.SimpleBoundary, self.tile.boundary(EAST, rank=rank)))
-                boundary_list[0].to_rank += self.tile.total_ranks
-                if boundary_list[0].to_rank > self.total_ranks:
-                    boundary_list[0].to_rank = boundary_list[0].to_rank%self.total_ranks
+                to_rank = (self.tile.to_rank(EAST, rank) + ttr)%tr
+                boundary_list = [self._unrotated_boundary(constants.EAST, rank, to_rank)]
         else:
-            boundary_list.append(cast(bd.SimpleBoundary, self.tile.boundary(EAST, rank=rank)))
+            to_rank = self.tile.to_rank(EAST, rank)
+            boundary_list = [self._unrotated_boundary(constants.EAST, rank, to_rank)]
         return boundary_list
 
-    def _top_edge(self, rank: int) -> bd.SimpleBoundary:
-        boundary_list = []
-        if self.tile.on_tile_top(rank):
-            if is_even(self.tile_index(rank)):
-                to_root_rank = (self.tile_index(rank) + 2) * self.tile.total_ranks
+    def _top_edge(self, rank: int) -> Tuple[bd.SimpleBoundary, ...]:
+        return self._boundaries[NORTH, rank]
+
+    def _compute_top_edge(self, rank: int) -> List[bd.SimpleBoundary]:
+        ttr = self.tile.total_ranks
+        tr = self.total_ranks
+        ti = self.tile_index(rank)
+        even = (ti & 1) == 0
+        flags = self.tile.edge_flags[rank % ttr]
+        if flags & ON_TILE_TOP:
+            if even:
+                to_root_rank = self.tile_root_rank(rank) + 2*ttr
                 to_ranks_seq = self.ul_to_ranks(rank, to_root_rank)
-                for n in range(0,len(to_ranks_seq)):
-                    boundary_list.append(bd.SimpleBoundary(
-                        boundary_type=constants.NORTH,
-                        from_rank=rank,
-                        to_rank=int(to_ranks_seq[n]%self.total_ranks),
-                        n_clockwise_rotations=3,
-                    ))
+                boundary_list = self._rotated_boundaries(constants.NORTH, rank, to_ranks_seq, 3)
             else:
-                boundary_list.append(cast(bd.SimpleBoundary, self.tile.boundary(NORTH, rank)))
-                boundary_list[0].to_rank += self.tile.total_ranks 
-                if boundary_list[0].to_rank > self.total_ranks:
-                    boundary_list[0].to_rank = boundary_list[0].to_rank%self.total_ranks
+                to_rank = (self.tile.to_rank(NORTH, rank) + ttr)%tr
+                boundary_list = [self._unrotated_boundary(constants.NORTH, rank, to_rank)]
         else:
-            boundary_list.append(cast(bd.SimpleBoundary, self.tile.boundary(NORTH, rank=rank)))
+            to_rank = self.tile.to_rank(NORTH, rank)
+            boundary_list = [self._unrotated_boundary(constants.NORTH, rank, to_rank)]
         return boundary_list
 
-    def _bottom_edge(self, rank: int) -> bd.SimpleBoundary:
-        boundary_list = []
-        if self.tile.on_tile_bottom(rank) and not is_even(self.tile_index(rank)):
-            to_root_rank = self.tile_root_rank(rank) + 4*self.tile.total_ranks
-            to_root_rank = to_root_rank%self.total_ranks
+    def _bottom_edge(self, rank: int) -> Tuple[bd.SimpleBoundary, ...]:
+        return self._boundaries[SOUTH, rank]
+
+    def _compute_bottom_edge(self, rank: int) -> List[bd.SimpleBoundary]:
+        ttr = self.tile.total_ranks
+        tr = self.total_ranks
+        ti = self.tile_index(rank)
+        even = (ti & 1) == 0
+        flags = self.tile.edge_flags[rank % ttr]
+        if flags & ON_TILE_BOTTOM and not even:
+            to_root_rank = self.tile_root_rank(rank) + 4*ttr
+            to_root_rank = to_root_rank%tr
             to_ranks_seq = self.ul_to_ranks(rank, to_root_rank)
-            for n in range(0,len(to_ranks_seq)):
-                boundary_list.append(bd.SimpleBoundary(
-                    boundary_type=constants.SOUTH,
-                    from_rank=rank,
-                    to_rank=int(to_ranks_seq[n]%self.total_ranks),
-                    n_clockwise_rotations=3,
-                ))
+            boundary_list = self._rotated_boundaries(constants.SOUTH, rank, to_ranks_seq, 3)
         else:
-            boundary_list.append(cast(bd.SimpleBoundary, self.tile.boundary(SOUTH, rank=rank)))
-            if self.tile.on_tile_bottom(rank):
-                boundary_list[0].to_rank -= self.tile.total_ranks
-                if boundary_list[0].to_rank < 0:
-                    boundary_list[0].to_rank = boundary_list[0].to_rank%self.total_ranks
+            to_rank = self.tile.to_rank(SOUTH, rank)
+            if flags & ON_TILE_BOTTOM:
+                to_rank = (to_rank - ttr)%tr
+            boundary_list = [self._unrotated_boundary(constants.SOUTH, rank, to_rank)]
         return boundary_list
 
+    def _unrotated_boundary(
+        self, boundary_type: int, rank: int, to_rank: int
+    ) -> bd.SimpleBoundary:
+        """Returns the boundary of a rank to a rank with the same orientation"""
+        return bd.SimpleBoundary(
+            boundary_type=boundary_type,
+            from_rank=rank,
+            to_rank=to_rank,
+            n_clockwise_rotations=0,
+        )
+
+    def _rotated_boundaries(
+        self,
+        boundary_type: int,
+        rank: int,
+        to_ranks_seq: Sequence[int],
+        n_clockwise_rotations: int,
+    ) -> List[bd.SimpleBoundary]:
+        """Returns the boundaries of a rank to the shared ranks on a rotated tile"""
+        # the shared ranks are a short range, reduce them without building an array
+        total_ranks = self.total_ranks
+        return [
+            bd.SimpleBoundary(
+                boundary_type=boundary_type,
+                from_rank=rank,
+                to_rank=to_rank % total_ranks,
+                n_clockwise_rotations=n_clockwise_rotations,
+            )
+            for to_rank in to_ranks_seq
+        ]
+
     def _top_left_corner(self, rank: int) -> Optional[bd.SimpleBoundary]:
-        if self.tile.on_tile_top(rank) and self.tile.on_tile_left(rank):
+        flags = self.tile.edge_flags[rank % self.tile.total_ranks]
+        if flags & ON_TILE_TOP and flags & ON_TILE_LEFT:
             corner = None
         else:
-            if is_even(self.tile_index(rank)) and on_tile_left(
-                self.tile.subtile_index(rank)
-            ):
+            if is_even(self.tile_index(rank)) and flags & ON_TILE_LEFT:
                 second_edge = self._left_edge
             else:
                 second_edge = self._top_edge
@@ -490,14 +639,11 @@ class CubedSpherePartitioner(Partitioner):
         return corner
 
     def _top_right_corner(self, rank: int) -> Optional[bd.SimpleBoundary]:
-        if on_tile_top(self.tile.subtile_index(rank), self.layout) and on_tile_right(
-            self.tile.subtile_index(rank), self.layout
-        ):
+        flags = self.tile.edge_flags[rank % self.tile.total_ranks]
+        if flags & ON_TILE_TOP and flags & ON_TILE_RIGHT:
             corner = None
         else:
-            if is_even(self.tile_index(rank)) and on_tile_top(
-                self.tile.subtile_index(rank), self.layout
-            ):
+            if is_even(self.tile_index(rank)) and flags & ON_TILE_TOP:
                 second_edge = self._bottom_edge
             else:
                 second_edge = self._right_edge
@@ -507,14 +653,11 @@ class CubedSpherePartitioner(Partitioner):
         return corner
 
     def _bottom_left_corner(self, rank: int) -> Optional[bd.SimpleBoundary]:
-        if on_tile_bottom(self.tile.subtile_index(rank)) and on_tile_left(
-            self.tile.subtile_index(rank)
-        ):
+        flags = self.tile.edge_flags[rank % self.tile.total_ranks]
+        if flags & ON_TILE_BOTTOM and flags & ON_TILE_LEFT:
             corner = None
         else:
-            if not is_even(self.tile_index(rank)) and on_tile_bottom(
-                self.tile.subtile_index(rank)
-            ):
+            if not is_even(self.tile_index(rank)) and flags & ON_TILE_BOTTOM:
                 second_edge = self._top_edge
             else:
                 second_edge = self._left_edge
@@ -524,14 +667,11 @@ class CubedSpherePartitioner(Partitioner):
         return corner
 
     def _bottom_right_corner(self, rank: int) -> Optional[bd.SimpleBoundary]:
-        if on_tile_bottom(self.tile.subtile_index(rank)) and on_tile_right(
-            self.tile.subtile_index(rank), self.layout
-        ):
+        flags = self.tile.edge_flags[rank % self.tile.total_ranks]
+        if flags & ON_TILE_BOTTOM and flags & ON_TILE_RIGHT:
             corner = None
         else:
-            if not is_even(self.tile_index(rank)) and on_tile_bottom(
-                self.tile.subtile_index(rank)
-            ):
+            if not is_even(self.tile_index(rank)) and flags & ON_TILE_BOTTOM:
                 second_edge = self._bottom_edge
             else:
                 second_edge = self._right_edge
@@ -624,159 +764,70 @@ class CubedSpherePartitioner(Partitioner):
     def lr_boundary_seq(self, rank: int):
         """Calculates the sequence of boundaries on an edge of a tile + the amount of to_ranks shared with this rank"""
         rank_position_y = (rank % self.tile.total_ranks) // self.tile.layout[0] # position of rank on left/right boundary in y-axis
-        boundary_seq = []
-        if self.tile.layout[0] % self.tile.layout[1] == 0 or self.tile.layout[1] % self.tile.layout[0] == 0: # layout is dividable
-            if self.tile.layout[0] >= self.tile.layout[1]:
-                div = self.tile.layout[0] // self.tile.layout[1]
-            else:
-                div = 1
-            boundary_seq = [div]*self.tile.layout[1]   # adds sequence of repeated multiples (div) in a list.
-            Nboundary = boundary_seq[rank_position_y]
-        else:
-            nfirst = self.tile.layout[0] // self.tile.layout[1] + 1
-            boundary_seq.append(nfirst)
-            for y in range(1,self.tile.layout[1]): # calculates the rest of the sequence of the boundary by dividing the layout
-                num1 = (self.tile.layout[0]*self.tile.layout[1]) - y*self.tile.layout[0]
-                num2before = num1//self.tile.layout[1] + 1
-                num2after = (num1 - self.tile.layout[0])//self.tile.layout[1] + 1
-                numadd = num2before - num2after + 1
-                boundary_seq.append(numadd)
-            Nboundary = boundary_seq[rank_position_y] # Amount of boundaries created on the edge of a rank
-        return Nboundary, boundary_seq
+        Nboundary = self._lr_boundary_counts[rank_position_y] # Amount of boundaries created on the edge of a rank
+        return Nboundary, self._lr_boundary_seq
 
     def ul_boundary_seq(self, rank: int): 
         """Calculates the sequence of boundaries on an edge of a tile + the amount of to_ranks shared with this rank"""
         rank_position_x = (rank % self.tile.total_ranks)//self.tile.layout[0] # position of rank on upper/ower boundary in x-axis
-        boundary_seq = []
-        if self.tile.layout[0] % self.tile.layout[1] == 0 or self.tile.layout[1] % self.tile.layout[0] == 0: # layout is dividable
-            if self.tile.layout[1] >= self.tile.layout[0]:
-                div = self.tile.layout[1]//self.tile.layout[0]
-            else:
-                div = 1
-            boundary_seq = [div]*self.tile.layout[0]
-            Nboundary = boundary_seq[rank_position_x]
-        else:
-            nfirst = self.tile.layout[1] // self.tile.layout[0] + 1
-            boundary_seq.append(nfirst)
-            for x in range(1,self.tile.layout[0]): # calculates the rest of the sequence of the boundary by dividing the layout
-                num1 = (self.tile.layout[0]*self.tile.layout[1]) - x*self.tile.layout[1]  
-                num2before = num1//self.tile.layout[0] + 1      
-                num2after = (num1-self.tile.layout[1])//self.tile.layout[0] + 1   
-                numadd = num2before - num2after + 1  
-                boundary_seq.append(numadd)
-            Nboundary = boundary_seq[rank_position_x] # Amount of boundaries created on the edge of a rank
-        return Nboundary, boundary_seq
-
-    def lr_to_ranks(self, rank: int, to_root_rank: int):
+        Nboundary = self._ul_boundary_counts[rank_position_x] # Amount of boundaries created on the edge of a rank
+        return Nboundary, self._ul_boundary_seq
+
+    def lr_to_ranks(self, rank: int, to_root_rank: int) -> Sequence[int]:
         """Returns the to_ranks of the boundaries for a specific rank and its edge"""
-        Nboundary, boundary_seq =  self.lr_boundary_seq(rank)
-        if self.tile.layout[0] % self.tile.layout[1] == 0 or self.tile.layout[1] % self.tile.layout[0] == 0:
-            div = self.tile.layout[1]//self.tile.layout[0]
-            boundary_seq = boundary_seq
-            if(div >= 1):
-                cumsum_boundary_seq = np.cumsum(boundary_seq)//div # cumulated sum of boundary sequence to calculate shared ranks later on
-            else:
-                cumsum_boundary_seq = np.cumsum(boundary_seq)
-        else:
-            boundary_seq = [x - 1 for x in boundary_seq]
-            cumsum_boundary_seq = np.cumsum(boundary_seq) # a cumulative sum of boundary_seq to know the start and end of the shared ranks 
         rank_position_y = (rank % self.tile.total_ranks) // self.tile.layout[0]
-        to_root_rank = to_root_rank
-        to_ranks_pot = []
-        for x in range(self.tile.layout[0]):
-            if self.tile.on_tile_left(rank):
-                to_ranks_pot.append(to_root_rank + (self.tile.layout[0]*(self.tile.layout[1]-1)) + x)
-            else:
-                to_ranks_pot.append(to_root_rank + x) # creates list of all sharable ranks (potential to_ranks) on the respective edge
-        to_ranks_pot = np.fliplr([to_ranks_pot, to_ranks_pot, to_ranks_pot])[1] # flips list for orientation purposes
-        if(rank_position_y == 0):
-            if self.tile.layout[0] % self.tile.layout[1] == 0 or self.tile.layout[1] % self.tile.layout[0] == 0:
-                if self.tile.layout[0]//self.tile.layout[1] >= 1:
-                    start = 0
-                    end = cumsum_boundary_seq[0]
-                    to_ranks_seq = to_ranks_pot[start:end]
-                else:
-                    start = 0
-                    div = self.tile.layout[1]//self.tile.layout[0]
-                    end = cumsum_boundary_seq[0]//div
-                    to_ranks_seq = to_ranks_pot[start:end] 
-            else:
-                start = 0
-                end = cumsum_boundary_seq[0]+1
-                to_ranks_seq = to_ranks_pot[start:end]
-        else:
-            if self.tile.layout[0]%self.tile.layout[1] == 0 or self.tile.layout[1]%self.tile.layout[0] == 0:
-                if self.tile.layout[0]/self.tile.layout[1] >= 1:
-                    start = cumsum_boundary_seq[rank_position_y-1]
-                    end = cumsum_boundary_seq[rank_position_y]
-                    to_ranks_seq = to_ranks_pot[start:end]
-                else:
-                    div = self.tile.layout[1]//self.tile.layout[0]
-                    start = rank_position_y//div
-                    end = start + 1
-                    to_ranks_seq = to_ranks_pot[start:end]
-            else:
-                start = cumsum_boundary_seq[rank_position_y-1]
-                end = cumsum_boundary_seq[rank_position_y] + 1
-                to_ranks_seq = to_ranks_pot[start:end]
-        return to_ranks_seq
+        on_left = self.tile.on_tile_left(rank)
+        first, stop = self._lr_to_rank_offsets[on_left][rank_position_y]
+        return range(to_root_rank + first, to_root_rank + stop, -1)
 
-    def ul_to_ranks(self, rank: int, to_root_rank: int):
+    def ul_to_ranks(self, rank: int, to_root_rank: int) -> Sequence[int]:
         """Returns the to_ranks of the boundaries for a specific rank and its edge"""
-        Nboundary, boundary_seq =  self.ul_boundary_seq(rank)
-        if self.tile.layout[0]%self.tile.layout[1] == 0 or self.tile.layout[1]%self.tile.layout[0] == 0:
-            div = self.tile.layout[1]//self.tile.layout[0]
-            boundary_seq = boundary_seq
-            if(div >= 1):
-                cumsum_boundary_seq = np.cumsum(boundary_seq)//div # cumulated sum of boundary sequence to calculate shared ranks later on
-            else:
-                cumsum_boundary_seq = np.cumsum(boundary_seq)
-        else:
-            boundary_seq = [x - 1 for x in boundary_seq]
-            cumsum_boundary_seq = np.cumsum(boundary_seq) # a cumulative sum of boundary_seq to know the start and end of the shared ranks 
         rank_position_x = (rank % self.tile.total_ranks)%self.tile.layout[0]
-        to_root_rank = to_root_rank
-        to_ranks_pot = []
-        for y in range(self.tile.layout[1]):
-            if self.tile.on_tile_top(rank):
-                to_ranks_pot.append(to_root_rank + self.tile.layout[0]*y) # creates list of all sharable ranks (potential to_ranks) on the respective edge
-            else:
-                to_ranks_pot.append(to_root_rank + self.tile.layout[0]*y + self.tile.layout[0]-1)
-                
-        to_ranks_pot = np.fliplr([to_ranks_pot,to_ranks_pot,to_ranks_pot])[1] # flips list for orientation         
-        if(rank_position_x == 0):
-            if self.tile.layout[0]%self.tile.layout[1] == 0 or self.tile.layout[1]%self.tile.layout[0] == 0:
-                if self.tile.layout[1]//self.tile.layout[0] > 1:
-                    div = self.tile.layout[1]//self.tile.layout[0]
-                    start = 0
-                    end = start + div
-                    to_ranks_seq = to_ranks_pot[start:end]
-                else:
-                    div = self.tile.layout[0]//self.tile.layout[1]
-                    start = 0
-                    end = start + 1
-                    to_ranks_seq = to_ranks_pot[start:end]
-            else:
-                start = 0
-                end = cumsum_boundary_seq[0]+1
-                to_ranks_seq = to_ranks_pot[start:end]
+        on_top = self.tile.on_tile_top(rank)
+        first, stop = self._ul_to_rank_offsets[on_top][rank_position_x]
+        return range(to_root_rank + first, to_root_rank + stop, -self.tile.layout[0])
+
+    def all_lr_to_ranks(self, on_left: bool, to_root_rank: int) -> List[Sequence[int]]:
+        """Returns the to_ranks of the boundaries for every rank along the left
+        or right edge of a tile, by position of the rank along the edge"""
+        return [
+            range(to_root_rank + first, to_root_rank + stop, -1)
+            for first, stop in self._lr_to_rank_offsets[on_left]
+        ]
+
+    def all_ul_to_ranks(self, on_top: bool, to_root_rank: int) -> List[Sequence[int]]:
+        """Returns the to_ranks of the boundaries for every rank along the upper
+        or lower edge of a tile, by position of the rank along the edge"""
+        step = -self.tile.layout[0]
+        return [
+            range(to_root_rank + first, to_root_rank + stop, step)
+            for first, stop in self._ul_to_rank_offsets[on_top]
+        ]
+
+
+@functools.lru_cache(maxsize=None)
+def _edge_boundary_seq(n_along: int, n_across: int) -> np.ndarray:
+    """Returns the number of boundaries of each rank along a tile edge with
+    n_across ranks, which borders a tile edge with n_along ranks.
+
+    The returned array is shared by all partitioners and is read-only.
+    """
+    if n_along % n_across == 0 or n_across % n_along == 0: # layout is dividable
+        if n_along >= n_across:
+            div = n_along // n_across
         else:
-            if self.tile.layout[0]%self.tile.layout[1] == 0 or self.tile.layout[1]%self.tile.layout[0] == 0:
-                if self.tile.layout[1]//self.tile.layout[0] > 1:
-                    div = self.tile.layout[1]//self.tile.layout[0]
-                    start = rank_position_x*div
-                    end = start + div
-                    to_ranks_seq = to_ranks_pot[start:end]
-                else:
-                    div = self.tile.layout[0]//self.tile.layout[1]
-                    start = rank_position_x//div
-                    end = start + 1
-                    to_ranks_seq = to_ranks_pot[start:end]
-            else:
-                start = cumsum_boundary_seq[rank_position_x-1]
-                end = cumsum_boundary_seq[rank_position_x] + 1
-                to_ranks_seq = to_ranks_pot[start:end]
-        return to_ranks_seq
+            div = 1
+        boundary_seq = np.full(n_across, div, dtype=np.int32) # sequence of repeated multiples (div)
+    else:
+        nfirst = n_along // n_across + 1
+        position = np.arange(1, n_across, dtype=np.int32) # calculates the rest of the sequence of the boundary by dividing the layout
+        num1 = n_along*n_across - position*n_along
+        num2before = num1//n_across + 1
+        num2after = (num1 - n_along)//n_across + 1
+        numadd = num2before - num2after + 1
+        boundary_seq = np.concatenate((np.array([nfirst], dtype=np.int32), numadd))
+    boundary_seq.flags.writeable = False
+    return boundary_seq
 
 
 def on_tile_left(subtile_index: Tuple[int, int, int, int]) -> bool:
@@ -795,22 +846,54 @@ def on_tile_bottom(subtile_index: Tuple[int, int, int, int]) -> bool:
     return subtile_index[2] == 0
 
 
+@functools.lru_cache(maxsize=None)
+def _subtile_indices(layout: Tuple[int, int]) -> Tuple[Tuple[int, int, int, int], ...]:
+    """Returns the subtile index of every rank within a tile of the given layout.
+
+    Looking the index up only reduces a rank to its tile, instead of dividing
+    it by the layout four times.
+    """
+    layout_0, layout_1 = layout
+    return tuple(
+        (
+            within_tile_rank // layout_1,
+            within_tile_rank % layout_0,
+            within_tile_rank // layout_0,
+            within_tile_rank % layout_1,
+        )
+        for within_tile_rank in range(layout_0 * layout_1)
+    )
+
+
 def rotate_subtile_rank(
     rank: int, layout: Tuple[int, int], n_clockwise_rotations: int
 ) -> int:
     """Returns the rank position where this rank would be if you rotated the
     tile n_clockwise_rotations times.
+
+    Ranks on other tiles of a cube are moved within their own tile.
     """
     if n_clockwise_rotations == 0:
-        to_tile_rank = rank
+        to_rank = rank
     elif n_clockwise_rotations == 1:
-        total_ranks = layout[0] * layout[1]
-        rank_array = np.arange(total_ranks).reshape(layout)
-        rotated_rank_array = np.rot90(rank_array)
-        to_tile_rank = rank_array[np.where(rotated_rank_array == rank)][0]
+        ranks_per_tile = layout[0] * layout[1]
+        within_tile_rank = rank % ranks_per_tile
+        if layout[0] == layout[1]:
+            # the position of rank in np.rot90 of the tile rank array
+            i, j = divmod(within_tile_rank, layout[1])
+            to_tile_rank = (layout[1] - 1 - j) * layout[1] + i
+        else:
+            # a rotated non-square tile has a different shape, so the rank
+            # array is searched
+            rank_array = np.arange(ranks_per_tile).reshape(layout)
+            rotated_rank_array = np.rot90(rank_array)
+            to_tile_rank = int(
+                rank_array[np.where(rotated_rank_array == within_tile_rank)][0]
+            )
+        to_rank = rank - within_tile_rank + to_tile_rank
     else:
         raise NotImplementedError()
-    return to_tile_rank
+    return to_rank
 
 
 def transpose_subtile_rank(rank, layout):
@@ -834,6 +917,16 @@ def flipud_subtile_rank(rank, layout):
     return transform_subtile_rank(np.flipud, rank, layout)
 
 
+# the rank permutations of transforms on the tile in closed form, for a rank
+# at index (i, j) = divmod(rank, layout[1]) of the tile rank array
+_SUBTILE_RANK_TRANSFORMS = {
+    # the position of rank (i, j) of the tile rank array after the transformation
+    np.transpose: lambda i, j, layout: j * layout[1] + i,
+    np.fliplr: lambda i, j, layout: i * layout[1] + (layout[1] - 1 - j),
+    np.flipud: lambda i, j, layout: (layout[0] - 1 - i) * layout[1] + j,
+}
+
+
 def transform_subtile_rank(
     transform_func: Callable[[np.ndarray], np.ndarray],
     rank: int,
@@ -841,22 +934,29 @@ def transform_subtile_rank(
 ):
     """Returns the rank position where this rank would be if you performed
     a transformation on the tile which strictly moves ranks.
+
+    Ranks on other tiles of a cube are moved within their own tile.
     """
-    total_ranks = layout[0] * layout[1]
-    rank_array = np.arange(total_ranks).reshape(layout)
+    ranks_per_tile = layout[0] * layout[1]
+    within_tile_rank = rank % ranks_per_tile
+    tile_root_rank = rank - within_tile_rank
+    # a transposed non-square tile has a different shape, so the closed form
+    # does not apply and the rank array is searched
+    if transform_func in _SUBTILE_RANK_TRANSFORMS and (
+        layout[0] == layout[1] or transform_func is not np.transpose
+    ):
+        i, j = divmod(within_tile_rank, layout[1])
+        return tile_root_rank + _SUBTILE_RANK_TRANSFORMS[transform_func](i, j, layout)
+    rank_array = np.arange(ranks_per_tile, dtype=np.int32).reshape(layout)
     transformed_rank_array = transform_func(rank_array)
-    return rank_array[np.where(transformed_rank_array == rank)][0]
+    to_tile_rank = rank_array[np.where(transformed_rank_array == within_tile_rank)][0]
+    return tile_root_rank + int(to_tile_rank)
 
 
 def subtile_index(
     rank: int, ranks_per_tile: int, layout: Tuple[int, int]
 ) -> Tuple[int, int, int, int]:
-    within_tile_rank = rank % ranks_per_tile
-    j = within_tile_rank // layout[1] 
-    i = within_tile_rank % layout[0]
-    k = within_tile_rank // layout[0] 
-    l = within_tile_rank % layout[1]
-    return j, i, k, l
+    return _subtile_indices(tuple(layout))[rank % ranks_per_tile]
 
 
 def is_even(value: Union[int, float]) -> bool:
@@ -878,10 +978,16 @@ def tile_extent_from_rank_metadata(
     Returns:
         tile_extent: the extent of one tile
     """
-    layout_factors = np.asarray(
-        utils.list_by_dims(dims, layout, non_horizontal_value=1)
+    return _cached_tile_extent_from_rank_metadata(
+        tuple(dims), tuple(rank_extent), tuple(layout)
     )
-    return extent_from_metadata(dims, rank_extent, layout_factors)
+
+
+@functools.lru_cache(maxsize=METADATA_CACHE_SIZE)
+def _cached_tile_extent_from_rank_metadata(
+    dims: Tuple[str, ...], rank_extent: Tuple[int, ...], layout: Tuple[int, int]
+) -> Tuple[int, ...]:
+    return _extent_from_layout(dims, rank_extent, layout, inverse=False)
 
 
 def rank_extent_from_tile_metadata(
@@ -899,63 +1005,65 @@ def rank_extent_from_tile_metadata(
     Returns:
         rank_extent: the extent of one rank
     """
-    layout_factors = 1 / np.asarray(
-        utils.list_by_dims(dims, layout, non_horizontal_value=1)
+    return _cached_rank_extent_from_tile_metadata(
+        tuple(dims), tuple(tile_extent), tuple(layout)
     )
-    return extent_from_metadata(dims, tile_extent, layout_factors)
 
 
-def extent_from_metadata(
-    dims: Iterable[str], extent: Iterable[int], layout_factors: np.ndarray
+@functools.lru_cache(maxsize=METADATA_CACHE_SIZE)
+def _cached_rank_extent_from_tile_metadata(
+    dims: Tuple[str, ...], tile_extent: Tuple[int, ...], layout: Tuple[int, int]
 ) -> Tuple[int, ...]:
-    return_extents = []
-    for dim, rank_extent, layout_factor in zip(dims, extent, layout_factors):
-        if dim in constants.INTERFACE_DIMS:
-            add_extent = -1
-        else:
-            add_extent = 0
-        tile_extent = (rank_extent + add_extent) * layout_factor - add_extent
-        return_extents.append(int(tile_extent))  # layout_factor is float, need to cast
-    return tuple(return_extents)
+    return _extent_from_layout(dims, tile_extent, layout, inverse=True)
 
 
-@dataclasses.dataclass
-class _IndexData1D:
-    dim: str
-    extent: int
-    i_subtile: int
-    n_ranks: int
+def _extent_from_layout(
+    dims: Tuple[str, ...],
+    extent: Tuple[int, ...],
+    layout: Tuple[int, int],
+    inverse: bool,
+) -> Tuple[int, ...]:
+    layout_factors = np.array(
+        utils.list_by_dims(dims, layout, non_horizontal_value=1), dtype=np.float64
+    )
+    # like zip, only use the dimensions given in all of the arguments
+    n_dims = min(len(dims), len(extent), len(layout_factors))
+    return_extents = _partitioner_kernels.extent_from_layout(
+        _interface_mask(dims)[:n_dims],
+        np.array(extent[:n_dims], dtype=np.int64),
+        layout_factors[:n_dims],
+        inverse,
+    )
+    return tuple(return_extents.tolist())
 
-    @property
-    def base_extent(self):
-        return self.extent - self.extent_minus_gridcell_count
 
-    @property
-    def extent_minus_gridcell_count(self):
-        if self.dim in constants.INTERFACE_DIMS:
-            return 1
-        else:
-            return 0
+def extent_from_metadata(
+    dims: Iterable[str], extent: Iterable[int], layout_factors: np.ndarray
+) -> Tuple[int, ...]:
+    is_interface = _interface_mask(tuple(dims))
+    extent = np.array(list(extent), dtype=np.int64)
+    # like zip, only use the dimensions given in all of the arguments
+    n_dims = min(len(is_interface), len(extent), len(layout_factors))
+    return_extents = _partitioner_kernels.extent_from_layout(
+        is_interface[:n_dims],
+        extent[:n_dims],
+        np.asarray(layout_factors, dtype=np.float64)[:n_dims],
+        False,
+    )
+    return tuple(return_extents.tolist())
 
-    @property
-    def is_end_index(self):
-        return self.i_subtile == self.n_ranks - 1
 
+@functools.lru_cache(maxsize=METADATA_CACHE_SIZE)
+def _interface_mask(dims: Tuple[str, ...]) -> np.ndarray:
+    """Returns a read-only array which is True for the interface dimensions.
 
-def _index_generator(dims, tile_extent, subtile_index, horizontal_layout):
-    subtile_extent = rank_extent_from_tile_metadata(
-        dims, tile_extent, horizontal_layout
-    )
-    quantity_layout = utils.list_by_dims(
-        dims, horizontal_layout, non_horizontal_value=1
-    )
-    quantity_subtile_index = utils.list_by_dims(
-        dims, subtile_index, non_horizontal_value=0
+    The array is shared by all calls with the same dims.
+    """
+    is_interface = np.array(
+        [dim in constants.INTERFACE_DIMS for dim in dims], dtype=np.bool_
     )
-    for dim, extent, i_subtile, n_ranks in zip(
-        dims, subtile_extent, quantity_subtile_index, quantity_layout
-    ):
-        yield _IndexData1D(dim, extent, i_subtile, n_ranks)
+    is_interface.flags.writeable = False
+    return is_interface
 
 
 def subtile_slice(
@@ -977,14 +1085,85 @@ def subtile_slice(
         overlap: whether to assign regions which belong to multiple ranks
             to both ranks, or only to the higher rank (default)
     """
-    return_list = []
+    return _cached_subtile_slice(
+        tuple(dims), tuple(global_extent), tuple(layout), tuple(subtile_index), overlap
+    )
+
+
+@functools.lru_cache(maxsize=METADATA_CACHE_SIZE)
+def _cached_subtile_slice(
+    dims: Tuple[str, ...],
+    global_extent: Tuple[int, ...],
+    layout: Tuple[int, int],
+    subtile_index: Tuple[int, ...],
+    overlap: bool,
+) -> Tuple[slice, ...]:
+    return slices_from_bounds(
+        *_cached_subtile_bounds(dims, global_extent, layout, subtile_index, overlap)
+    )
+
+
+def subtile_bounds(
+    dims: Iterable[str],
+    global_extent: Iterable[int],
+    layout: Tuple[int, int],
+    subtile_index: Tuple[int, int, int, int],
+    overlap: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the start and end indices of the data within a tile's computational
+    domain belonging to a single rank, which are the bounds of subtile_slice.
+
+    Args:
+        dims: dimension names for each axis
+        global_extent: size of the tile or cube's computational domain
+        layout: the (y, x) number of ranks along each tile axis
+        subtile_index: the (y, x) position of the rank on the tile
+        overlap: whether to assign regions which belong to multiple ranks
+            to both ranks, or only to the higher rank (default)
+
+    Returns:
+        starts: read-only int64 array of the start index along each axis
+        ends: read-only int64 array of the end index along each axis
+    """
+    return _cached_subtile_bounds(
+        tuple(dims), tuple(global_extent), tuple(layout), tuple(subtile_index), overlap
+    )
+
+
+@functools.lru_cache(maxsize=METADATA_CACHE_SIZE)
+def _cached_subtile_bounds(
+    dims: Tuple[str, ...],
+    global_extent: Tuple[int, ...],
+    layout: Tuple[int, int],
+    subtile_index: Tuple[int, ...],
+    overlap: bool,
+) -> Tuple[np.ndarray, np.ndarray]:
+    subtile_extent = rank_extent_from_tile_metadata(dims, global_extent, layout)
+    quantity_layout = utils.list_by_dims(dims, layout, non_horizontal_value=1)
+    quantity_subtile_index = utils.list_by_dims(
+        dims, subtile_index, non_horizontal_value=0
+    )
+    n_dims = len(subtile_extent)
+    extent = np.array(subtile_extent, dtype=np.int64)
+    i_subtile = np.array(quantity_subtile_index[:n_dims], dtype=np.int64)
+    n_ranks = np.array(quantity_layout[:n_dims], dtype=np.int64)
+    base_extent = extent - _interface_mask(dims)[:n_dims]
+    starts = i_subtile * base_extent
     # discard last index for interface variables, unless you're the last rank
     # done so that only one rank is responsible for the shared interface point
-    for index in _index_generator(dims, global_extent, subtile_index, layout):
-        start = index.i_subtile * index.base_extent
-        if index.is_end_index or overlap:
-            end = start + index.extent
-        else:
-            end = start + index.base_extent
-        return_list.append(slice(start, end))
-    return tuple(return_list)
\ No newline at end of file
+    ends = starts + np.where((i_subtile == n_ranks - 1) | overlap, extent, base_extent)
+    # the arrays are shared by all callers with the same arguments
+    starts.flags.writeable = False
+    ends.flags.writeable = False
+    return starts, ends
+
+
+def slices_from_bounds(
+    starts: Sequence[int], ends: Sequence[int]
+) -> Tuple[slice, ...]:
+    """
+    Returns the slices from start to end index along each axis, for example
+    the slice of subtile_slice from the bounds of subtile_bounds.
+    """
+    return tuple(slice(int(start), int(end)) for start, end in zip(starts, ends))
@@ -0,0 +1,284 @@
+"Unit tests of the rank transformations and boundaries of the Partitioner"
+
+import itertools
+import numpy as np
+import pytest
+from fv3gfs.util import boundary as bd
+from fv3gfs.util.constants import (
+    EAST,
+    NORTH,
+    SOUTH,
+    WEST,
+    X_DIM,
+    X_INTERFACE_DIM,
+    Y_DIM,
+    Y_INTERFACE_DIM,
+    Z_DIM,
+)
+from fv3gfs.util.partitioner import (
+    CubedSpherePartitioner,
+    TilePartitioner,
+    extent_from_metadata,
+    fliplr_subtile_rank,
+    flipud_subtile_rank,
+    rank_extent_from_tile_metadata,
+    rotate_subtile_rank,
+    slices_from_bounds,
+    subtile_bounds,
+    subtile_slice,
+    tile_extent_from_rank_metadata,
+    transform_subtile_rank,
+    transpose_subtile_rank,
+)
+
+LAYOUTS = [(1, 1), (2, 2), (2, 3), (3, 2), (3, 5), (4, 4), (5, 3)]
+SQUARE_LAYOUTS = [layout for layout in LAYOUTS if layout[0] == layout[1]]
+NON_SQUARE_LAYOUTS = [layout for layout in LAYOUTS if layout[0] != layout[1]]
+
+
+def search_subtile_rank(transform_func, rank, layout):
+    """Returns the rank position by searching the transformed tile rank array"""
+    rank_array = np.arange(layout[0] * layout[1]).reshape(layout)
+    return rank_array[np.where(transform_func(rank_array) == rank)][0]
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+@pytest.mark.parametrize(
+    "subtile_rank_func, transform_func",
+    [(fliplr_subtile_rank, np.fliplr), (flipud_subtile_rank, np.flipud)],
+)
+def test_flip_subtile_rank_matches_array_search(
+    subtile_rank_func, transform_func, layout
+):
+    for rank in range(layout[0] * layout[1]):
+        assert subtile_rank_func(rank, layout) == search_subtile_rank(
+            transform_func, rank, layout
+        )
+
+
+@pytest.mark.parametrize("layout", SQUARE_LAYOUTS)
+def test_transpose_subtile_rank_matches_array_search(layout):
+    for rank in range(layout[0] * layout[1]):
+        assert transpose_subtile_rank(rank, layout) == search_subtile_rank(
+            np.transpose, rank, layout
+        )
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+@pytest.mark.parametrize("transform_func", [np.fliplr, np.flipud, np.transpose])
+def test_transform_subtile_rank_stays_on_tile(transform_func, layout):
+    if transform_func is np.transpose and layout[0] != layout[1]:
+        pytest.skip("transposing a non-square tile does not just move ranks")
+    ranks_per_tile = layout[0] * layout[1]
+    # wrapping the transformation in a lambda searches the rank array instead
+    for func in (transform_func, lambda array: transform_func(array)):
+        for tile in range(6):
+            tile_ranks = range(tile * ranks_per_tile, (tile + 1) * ranks_per_tile)
+            to_ranks = [
+                transform_subtile_rank(func, rank, layout) for rank in tile_ranks
+            ]
+            assert sorted(to_ranks) == list(tile_ranks)
+            assert to_ranks == [
+                tile * ranks_per_tile
+                + search_subtile_rank(transform_func, rank, layout)
+                for rank in range(ranks_per_tile)
+            ]
+
+
+@pytest.mark.parametrize("layout", SQUARE_LAYOUTS)
+@pytest.mark.parametrize("n_clockwise_rotations", [0, 1])
+def test_rotate_subtile_rank_matches_array_search(n_clockwise_rotations, layout):
+    def rotate(array):
+        return np.rot90(array, k=n_clockwise_rotations)
+
+    ranks_per_tile = layout[0] * layout[1]
+    for tile in range(6):
+        tile_ranks = range(tile * ranks_per_tile, (tile + 1) * ranks_per_tile)
+        to_ranks = [
+            rotate_subtile_rank(rank, layout, n_clockwise_rotations)
+            for rank in tile_ranks
+        ]
+        assert sorted(to_ranks) == list(tile_ranks)
+        assert to_ranks == [
+            tile * ranks_per_tile + search_subtile_rank(rotate, rank, layout)
+            for rank in range(ranks_per_tile)
+        ]
+
+
+@pytest.mark.parametrize("layout", NON_SQUARE_LAYOUTS)
+def test_rotate_subtile_rank_of_non_square_layout_searches_rank_array(layout):
+    for rank in range(layout[0] * layout[1]):
+        try:
+            expected = search_subtile_rank(np.rot90, rank, layout)
+        except IndexError:
+            continue
+        assert rotate_subtile_rank(rank, layout, 1) == expected
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+def test_top_edge_of_last_tile_wraps_to_first_tile(layout):
+    partitioner = CubedSpherePartitioner(TilePartitioner(layout))
+    # the top row of the last tile borders the bottom row of the first tile,
+    # the last rank must not point to rank total_ranks
+    for rank_position_x in range(layout[0]):
+        rank = partitioner.total_ranks - layout[0] + rank_position_x
+        assert partitioner.boundary(NORTH, rank) == (
+            bd.SimpleBoundary(
+                boundary_type=NORTH,
+                from_rank=rank,
+                to_rank=rank_position_x,
+                n_clockwise_rotations=0,
+            ),
+        )
+
+
+def boundary_row(boundary):
+    return [
+        boundary.to_rank,
+        boundary.n_clockwise_rotations,
+        boundary.boundary_type,
+        boundary.from_rank,
+    ]
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+def test_boundary_array_matches_edge_boundaries(layout):
+    partitioner = CubedSpherePartitioner(TilePartitioner(layout))
+    for rank in range(partitioner.total_ranks):
+        boundary_array = partitioner.boundary_array(rank)
+        expected = [
+            boundary_row(boundary)
+            for boundary_type in (WEST, EAST, NORTH, SOUTH)
+            for boundary in partitioner.boundary(boundary_type, rank)
+        ]
+        assert boundary_array.shape == (len(expected), 4)
+        assert boundary_array.tolist() == expected
+        assert not boundary_array.flags.writeable
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+def test_tile_all_boundaries_matches_boundary(layout):
+    partitioner = TilePartitioner(layout)
+    all_boundaries = partitioner.all_boundaries()
+    assert all_boundaries.shape == (8, partitioner.total_ranks, 4)
+    for boundary_type in range(8):
+        for rank in range(partitioner.total_ranks):
+            assert all_boundaries[boundary_type, rank].tolist() == boundary_row(
+                partitioner.boundary(boundary_type, rank)
+            )
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+def test_cubed_sphere_all_boundaries_matches_boundary_array(layout):
+    partitioner = CubedSpherePartitioner(TilePartitioner(layout))
+    expected = np.concatenate(
+        [partitioner.boundary_array(rank) for rank in range(partitioner.total_ranks)]
+    )
+    np.testing.assert_array_equal(partitioner.all_boundaries(), expected)
+
+
+SUBTILE_DIMS = [
+    (Y_DIM, X_DIM),
+    (Y_INTERFACE_DIM, X_DIM),
+    (Y_DIM, X_INTERFACE_DIM, Z_DIM),
+    (Z_DIM, Y_INTERFACE_DIM, X_INTERFACE_DIM),
+]
+
+
+def layout_factor(dim, layout):
+    """Returns the number of ranks along a dimension of the tile"""
+    if dim in (Y_DIM, Y_INTERFACE_DIM):
+        return layout[0]
+    elif dim in (X_DIM, X_INTERFACE_DIM):
+        return layout[1]
+    return 1
+
+
+def tile_extent(dims, layout, n_points=4, n_levels=3):
+    """Returns a tile extent which can be evenly divided by the layout"""
+    extent = []
+    for dim in dims:
+        if dim == Z_DIM:
+            extent.append(n_levels)
+        else:
+            is_interface = dim in (X_INTERFACE_DIM, Y_INTERFACE_DIM)
+            extent.append(n_points * layout_factor(dim, layout) + is_interface)
+    return tuple(extent)
+
+
+@pytest.mark.parametrize("layout", [(1, 1), (2, 2), (2, 3), (3, 2)])
+@pytest.mark.parametrize("dims", SUBTILE_DIMS)
+def test_subtile_bounds_cover_tile_once(dims, layout):
+    global_extent = tile_extent(dims, layout)
+    n_assigned = np.zeros(global_extent, dtype=int)
+    for index in itertools.product(range(layout[0]), range(layout[1])):
+        starts, ends = subtile_bounds(dims, global_extent, layout, index)
+        assert starts.dtype == ends.dtype == np.int64
+        assert not starts.flags.writeable and not ends.flags.writeable
+        subtile = slices_from_bounds(starts, ends)
+        assert subtile == subtile_slice(dims, global_extent, layout, index)
+        n_assigned[subtile] += 1
+    # without overlap, the points shared by ranks belong to the higher rank only
+    assert np.all(n_assigned == 1)
+
+
+@pytest.mark.parametrize("layout", [(1, 1), (2, 2), (2, 3), (3, 2)])
+@pytest.mark.parametrize("dims", SUBTILE_DIMS)
+def test_overlapping_subtile_bounds_have_rank_extent(dims, layout):
+    global_extent = tile_extent(dims, layout)
+    rank_extent = rank_extent_from_tile_metadata(dims, global_extent, layout)
+    for index in itertools.product(range(layout[0]), range(layout[1])):
+        starts, ends = subtile_bounds(dims, global_extent, layout, index, overlap=True)
+        assert tuple((ends - starts).tolist()) == rank_extent
+        assert slices_from_bounds(starts, ends) == subtile_slice(
+            dims, global_extent, layout, index, overlap=True
+        )
+
+
+def test_slices_from_bounds():
+    assert slices_from_bounds([0, 2], [3, 5]) == (slice(0, 3), slice(2, 5))
+    assert slices_from_bounds(np.array([1]), np.array([4])) == (slice(1, 4),)
+    assert slices_from_bounds([], []) == ()
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+def test_all_lr_to_ranks_matches_lr_to_ranks(layout):
+    partitioner = CubedSpherePartitioner(TilePartitioner(layout))
+    ranks_per_tile = layout[0] * layout[1]
+    for to_root_rank in (0, 2 * ranks_per_tile, 5 * ranks_per_tile):
+        for on_left, rank_position_x in ((True, 0), (False, layout[0] - 1)):
+            all_to_ranks = partitioner.all_lr_to_ranks(on_left, to_root_rank)
+            assert len(all_to_ranks) == layout[1]
+            for rank_position_y, to_ranks in enumerate(all_to_ranks):
+                rank = rank_position_y * layout[0] + rank_position_x
+                if partitioner.tile.on_tile_left(rank) == on_left:
+                    assert list(to_ranks) == list(
+                        partitioner.lr_to_ranks(rank, to_root_rank)
+                    )
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+def test_all_ul_to_ranks_matches_ul_to_ranks(layout):
+    partitioner = CubedSpherePartitioner(TilePartitioner(layout))
+    ranks_per_tile = layout[0] * layout[1]
+    for to_root_rank in (0, 2 * ranks_per_tile, 5 * ranks_per_tile):
+        for on_top, rank_position_y in ((True, layout[1] - 1), (False, 0)):
+            all_to_ranks = partitioner.all_ul_to_ranks(on_top, to_root_rank)
+            assert len(all_to_ranks) == layout[0]
+            for rank_position_x, to_ranks in enumerate(all_to_ranks):
+                rank = rank_position_y * layout[0] + rank_position_x
+                if partitioner.tile.on_tile_top(rank) == on_top:
+                    assert list(to_ranks) == list(
+                        partitioner.ul_to_ranks(rank, to_root_rank)
+                    )
+
+
+@pytest.mark.parametrize("layout", [(1, 1), (2, 2), (2, 3), (3, 2)])
+@pytest.mark.parametrize("dims", SUBTILE_DIMS)
+def test_extent_from_metadata_matches_layout_extents(dims, layout):
+    global_extent = tile_extent(dims, layout)
+    rank_extent = rank_extent_from_tile_metadata(dims, global_extent, layout)
+    layout_factors = np.array([layout_factor(dim, layout) for dim in dims])
+    assert extent_from_metadata(dims, global_extent, 1 / layout_factors) == rank_extent
+    assert extent_from_metadata(dims, rank_extent, layout_factors) == global_extent
+    assert tile_extent_from_rank_metadata(dims, rank_extent, layout) == global_extent